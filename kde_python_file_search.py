@@ -5,92 +5,470 @@ kde_python_file_search.py
 Application de recherche de fichiers pour Debian KDE Plasma.
 Fonctionnalités:
 - Cherche un mot-clé dans les noms de fichiers et dossiers (partiel ou entier, insensible à la casse)
+- Plusieurs mots-clés séparés par des virgules, jokers style shell (*.log, foo*bar)
+- Mode expression régulière, avec RE2 (pyre2) si installé
 - Recherche sur tout le système (selon permissions) ou sur points de montage externes montés
 - Indicateur de chargement pendant la recherche
 - Résultats affichés sous le champ de recherche
 - Copier le chemin, ouvrir le dossier parent dans un terminal (konsole si disponible)
 
-Dépendances: python3, PyQt5
+Dépendances: python3, PyQt5 (optionnel: pyre2 pour le mode expression régulière)
 Installation (Debian): sudo apt install python3 python3-pyqt5
 
 Note de sécurité: Ce programme ne modifiera pas automatiquement les permissions (chmod).
 Si vous avez besoin d'accéder à des répertoires protégés, lancez l'application avec des privilèges root (pkexec/sudo).
 """
 
+import fnmatch
+import multiprocessing
 import os
+import re
+import select
 import sys
-import fnmatch
-import stat
-import subprocess
-from threading import Event
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # RE2 (pyre2) si disponible pour le mode expression régulière: automate en temps
+    # linéaire, une expression saisie ne peut pas bloquer la recherche.
+    import re2 as _re
+except ImportError:
+    import re as _re
 
-from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import QUrl
 from PyQt5.QtGui import QDesktopServices
 
 
+# Préfixes des devices considérés comme disques externes (heuristique simple).
+_EXT_PREFIXES = ('/dev/sd', '/dev/mmcblk', '/dev/nvme')
+
+# Cache de /proc/mounts. Le fichier reste ouvert: le noyau signale toute modification
+# de la table des montages par POLLPRI, ce qui rend la vérification O(1). Le mtime
+# de /proc/mounts ne change pas lors d'un montage et ne peut pas servir de clé.
+_MOUNTS_CACHE = {'file': None, 'poll': None, 'val': []}
+
+
+def read_mounts():
+    """Retourne la liste des (device, point de montage) lus dans /proc/mounts.
+    Les caractères spéciaux des chemins (espace = \\040, ...) sont décodés.
+    Le fichier n'est relu que si la table des montages a changé.
+    """
+    cache = _MOUNTS_CACHE
+    try:
+        if cache['file'] is None:
+            f = open('/proc/mounts', 'r')
+            poller = select.poll()
+            poller.register(f, select.POLLPRI)
+            cache['file'], cache['poll'] = f, poller
+        elif not cache['poll'].poll(0):
+            return cache['val']
+        f = cache['file']
+        f.seek(0)
+        mounts = []
+        for line in f:
+            parts = line.split(None, 2)
+            if len(parts) >= 2:
+                mnt = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), parts[1])
+                mounts.append((parts[0], mnt))
+        cache['val'] = mounts
+    except Exception:
+        pass
+    return cache['val']
+
+
 def find_mounts_external():
     """Retourne une liste de points de montage qui semblent être des disques externes/USB.
     On lit /proc/mounts et on filtre les devices qui commencent par /dev/sd ou /dev/mmcblk ou mtdblock
     (heuristique simple).
     """
     mounts = []
+    for dev, mnt in read_mounts():
+        if dev.startswith(_EXT_PREFIXES):
+            mounts.append(mnt)
+    return sorted(set(mounts))
+
+
+def parse_patterns(text):
+    """Découpe la saisie en motifs séparés par des virgules (vides ignorés)."""
+    return [p.strip() for p in text.split(',') if p.strip()]
+
+
+def compile_regex(pattern):
+    """Compile une expression régulière saisie par l'utilisateur, insensible à la casse
+    (RE2 si disponible). Lève une exception si l'expression est invalide.
+    Le drapeau en ligne (?i) est compris par re comme par toutes les liaisons RE2.
+    """
+    return _re.compile('(?i)' + pattern)
+
+
+def build_matcher(patterns, regex=False):
+    """Compile les motifs en une seule expression régulière insensible à la casse et
+    retourne une fonction de recherche sur un nom en bytes (None si aucun motif ne
+    correspond).
+    Un motif sans joker est cherché comme sous-chaîne du nom; un motif avec joker
+    (*, ?, [...]) suit la syntaxe fnmatch et doit correspondre au nom entier
+    (ex: *.log, foo*bar).
+    Les noms ne sont décodés que si nécessaire: pour des motifs ASCII sans ? ni [...]
+    la recherche sur les bytes donne le même résultat (la casse ASCII est ignorée,
+    * couvre n'importe quels octets), sinon le nom est décodé avant la recherche.
+    Avec `regex`, l'unique motif est une expression régulière (voir compile_regex),
+    appliquée aux bytes du nom avec RE2 (décodé avec re): une alternative comme
+    (foo|bar|baz\\.log) est testée en un seul passage.
+    """
+    if regex:
+        if _re is not re:
+            # RE2 travaille nativement sur de l'UTF-8: motif en bytes, aucun décodage
+            # ni frame Python par nom ((?i) s'applique toujours).
+            return _re.compile(b'(?i)' + patterns[0].encode('utf-8')).search
+        search = compile_regex(patterns[0]).search
+        return lambda name: search(name.decode('utf-8', 'surrogateescape'))
+    parts = []
+    for p in patterns:
+        if any(c in p for c in '*?['):
+            parts.append(r'\A' + fnmatch.translate(p))
+        else:
+            parts.append(re.escape(p))
+    pattern = '|'.join(parts)
+    if all(p.isascii() and '?' not in p and '[' not in p for p in patterns):
+        # Cas courant: la méthode search liée est appelée directement depuis la boucle
+        # (variable locale). Une fonction Python intermédiaire, comme celle du cas
+        # décodé ci-dessous, coûte une frame par nom et s'est montrée 1,5x plus lente.
+        return re.compile(pattern.encode('ascii'), re.IGNORECASE).search
+    search = re.compile(pattern, re.IGNORECASE).search
+    return lambda name: search(name.decode('utf-8', 'surrogateescape'))
+
+
+def _display_path(path):
+    """Texte affiché pour un chemin trouvé (str décodé par os.fsdecode). Un nom qui
+    n'est pas de l'UTF-8 valide est affiché avec des caractères de remplacement.
+    """
     try:
-        with open('/proc/mounts', 'r') as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) >= 2:
-                    dev, mnt = parts[0], parts[1]
-                    if dev.startswith('/dev/sd') or dev.startswith('/dev/mmcblk') or dev.startswith('/dev/nvme'):
-                        mounts.append(mnt)
-    except Exception:
+        path.encode('utf-8')
+        return path
+    except UnicodeEncodeError:
+        return os.fsencode(path).decode('utf-8', 'replace')
+
+
+def _file_url(path):
+    """URL file:// d'un chemin trouvé. Les octets non UTF-8 du nom sont gardés en %XX,
+    QUrl.fromLocalFile les remplacerait.
+    """
+    from urllib.parse import quote
+    return QUrl.fromEncoded(b'file://' + quote(os.fsencode(path)).encode('ascii'))
+
+
+# Contexte "spawn": les processus de recherche ne doivent pas hériter (fork) de l'état Qt.
+_MP = multiprocessing.get_context('spawn')
+
+# Nombre de résultats regroupés par message: un signal Qt par lot plutôt que par chemin.
+BATCH_SIZE = 256
+
+# Systèmes de fichiers virtuels: des millions d'entrées synthétiques sans intérêt
+# pour une recherche de fichiers, jamais parcourus.
+PSEUDO_FS = {'/proc', '/sys', '/dev', '/run', '/var/run', '/var/lock', '/snap'}
+
+# Etat propre à chaque processus du pool, fixé par _init_scan_process.
+_scan_stop = None
+_scan_queue = None
+_scan_progress = None
+
+
+def _init_scan_process(stop_flag, queue, progress):
+    global _scan_stop, _scan_queue, _scan_progress
+    _scan_stop = stop_flag
+    _scan_queue = queue
+    _scan_progress = progress
+
+
+def _scan_dir(d, match, skip, add, push, stop, prune=False):
+    """Parcourt un seul dossier: les chemins dont le nom correspond sont passés à `add`,
+    les sous-dossiers à parcourir à `push`. Avec `prune`, un dossier trouvé n'est pas
+    parcouru.
+    """
+    try:
+        it = os.scandir(d)
+    except OSError:
+        return
+    # readdir peut échouer en cours de lecture (EIO, NFS/FUSE, handle périmé): on garde
+    # ce qui a été lu et le parcours continue avec les autres dossiers.
+    try:
+        with it:
+            count = 0
+            for entry in it:
+                count += 1
+                if (count & 1023) == 0 and stop.value:
+                    return
+                if match(entry.name) is not None:
+                    add(entry.path)
+                    if prune:
+                        continue
+                try:
+                    isdir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    isdir = False
+                # Les liens symboliques ne sont jamais suivis (is_dir sans
+                # follow_symlinks), ce qui évite les boucles.
+                if isdir:
+                    path = entry.path
+                    if path not in skip:
+                        push(path)
+    except OSError:
         pass
-    return sorted(set(mounts))
+
+
+def _scan_root(index, roots, patterns, one_filesystem=False, threads=1, prune=False, regex=False):
+    """Parcourt `roots[index]` sans descendre dans les autres racines, ni dans les points
+    de montage avec `one_filesystem`, ni dans les dossiers trouvés avec `prune`, sur
+    `threads` threads. Envoie ('found', [chemins]) puis toujours ('done', index).
+    """
+    put = _scan_queue.put
+    try:
+        # Motifs compilés une fois par processus: pas de copie en minuscules de
+        # chaque nom de fichier, tous les motifs testés en un seul passage.
+        pat = build_matcher(patterns, regex)
+        # Parcours en bytes: os.scandir ne décode pas chaque nom, seuls les chemins
+        # trouvés sont décodés avant l'envoi.
+        root = os.fsencode(roots[index])
+        mounts = {os.fsencode(mnt) for _, mnt in read_mounts()}
+        # Un seul ensemble de chemins à ne pas parcourir: un test par dossier.
+        skip = {os.fsencode(p) for p in PSEUDO_FS}
+        skip.update(os.fsencode(r) for r in roots)
+        if one_filesystem:
+            skip.update(mounts)
+        skip.discard(root)
+        # Points de montage et racines déjà parcourus, par (st_dev, st_ino).
+        seen = set()
+        for r in roots:
+            if os.fsencode(r) != root:
+                try:
+                    st = os.stat(r)
+                except OSError:
+                    continue
+                seen.add((st.st_dev, st.st_ino))
+        stop = _scan_stop
+        progress = _scan_progress
+        # Parcours en profondeur itératif: pas de limite de récursion.
+        stack = [root]
+        # La racine elle-même est un résultat si son nom correspond (ex: ~/foo_projet
+        # cherché avec foo); avec `prune`, elle n'est alors pas parcourue.
+        name = os.path.basename(root)
+        if name and pat(name) is not None:
+            put(('found', [os.fsdecode(root)]))
+            if prune:
+                return
+
+        def walk(take, give):
+            """Boucle d'un parcoureur: `take` fournit le prochain dossier (None quand il
+            n'y en a plus), `give` reçoit ses sous-dossiers et retourne le nombre total de
+            dossiers parcourus.
+            """
+            # Chemins décodés avec surrogateescape (os.fsdecode): réversibles, l'interface
+            # retrouve le vrai chemin d'un nom qui n'est pas de l'UTF-8 valide.
+            def send(paths):
+                put(('found', [os.fsdecode(p) for p in paths]))
+
+            buf = []
+            add = buf.append
+            subdirs = []
+            push = subdirs.append
+            try:
+                while True:
+                    d = take()
+                    if d is None:
+                        return
+                    # `give` est toujours appelé: en mode parallèle, un thread qui lève
+                    # une exception ne doit pas laisser le dossier compté comme en cours
+                    # (les autres attendraient indéfiniment).
+                    try:
+                        _scan_dir(d, pat, skip, add, push, stop, prune)
+                    finally:
+                        total = give(subdirs)
+                        del subdirs[:]
+                    if len(buf) >= BATCH_SIZE:
+                        send(buf)
+                        buf = []
+                        add = buf.append
+                    elif total % 500 == 0 and buf:
+                        send(buf)
+                        buf = []
+                        add = buf.append
+            finally:
+                if buf:
+                    send(buf)
+
+        total = [0]
+
+        def take():
+            while stack and not stop.value:
+                d = stack.pop()
+                if d in mounts or d == root:
+                    try:
+                        st = os.stat(d)
+                    except OSError:
+                        continue
+                    key = (st.st_dev, st.st_ino)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                return d
+            return None
+
+        def give(subdirs):
+            stack.extend(subdirs)
+            total[0] += 1
+            progress[index] = total[0]
+            return total[0]
+
+        if threads > 1:
+            # Pile partagée: un thread n'abandonne que si la pile est vide et
+            # qu'aucun autre n'est en train de lire un dossier (qui pourrait
+            # en ajouter de nouveaux).
+            cond = threading.Condition()
+            busy = [0]
+
+            def take_shared():
+                with cond:
+                    while True:
+                        # Attente bornée: le drapeau d'arrêt est écrit sans notification.
+                        while not stack and busy[0] and not stop.value:
+                            cond.wait(0.1)
+                        item = take()
+                        if item is not None:
+                            busy[0] += 1
+                            return item
+                        # take() a pu vider la pile en écartant des points de montage
+                        # déjà vus: tant qu'un autre thread lit un dossier, on attend.
+                        if not busy[0] or stop.value:
+                            cond.notify_all()
+                            return None
+
+            def give_shared(subdirs):
+                with cond:
+                    busy[0] -= 1
+                    n = give(subdirs)
+                    if subdirs or not busy[0]:
+                        cond.notify_all()
+                    return n
+
+            workers = [threading.Thread(target=walk, args=(take_shared, give_shared), daemon=True)
+                       for _ in range(threads)]
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
+        else:
+            walk(take, give)
+    finally:
+        put(('done', index))
 
 
 class SearchWorker(QtCore.QThread):
+    """Répartit les racines sur un pool de processus (une tâche par racine, hors du GIL)
+    et réémet leurs résultats sous forme de signaux Qt.
+    """
     found = pyqtSignal(str)
+    foundBatch = pyqtSignal(list)
+    error = pyqtSignal(str, str)  # racine, message
     finished = pyqtSignal()
-    progress = pyqtSignal(int)
 
-    def __init__(self, roots, keyword, stop_event: Event):
+    def __init__(self, roots, patterns, stop_flag, processes=None, one_filesystem=False, threads=1,
+                 prune=False, regex=False):
         super().__init__()
         self.roots = roots
-        self.keyword = keyword.lower()
-        self._stop_event = stop_event
+        self.patterns = patterns
+        self.one_filesystem = one_filesystem
+        self.threads = threads
+        self.prune = prune
+        self.regex = regex
+        self._stop_flag = stop_flag
+        self.processes = processes or os.cpu_count() or 1
+        # Dossiers parcourus, une case par racine écrite directement par les processus
+        # de recherche (mémoire partagée, sans signal): l'interface l'échantillonne.
+        self.progress_count = _MP.RawArray('q', len(roots))
+
+    def dirs_visited(self):
+        return sum(self.progress_count)
 
     def run(self):
-        total = 0
-        for root in self.roots:
-            for dirpath, dirnames, filenames in os.walk(root, onerror=lambda e: None):
-                if self._stop_event.is_set():
-                    self.finished.emit()
-                    return
-                name = os.path.basename(dirpath).lower()
-                if self.keyword in name:
-                    self.found.emit(dirpath)
-                for fname in filenames:
-                    if self._stop_event.is_set():
-                        self.finished.emit()
-                        return
-                    if self.keyword in fname.lower():
-                        full = os.path.join(dirpath, fname)
-                        self.found.emit(full)
-                total += 1
-                if total % 500 == 0:
-                    self.progress.emit(total)
+        queue = _MP.Queue()
+        size = min(len(self.roots), self.processes)
+
+        def on_task_done(future, index):
+            # Tâche en échec (exception, processus mort: BrokenProcessPool): la racine
+            # est signalée à l'interface et sa fin envoyée ici, sinon la boucle
+            # ci-dessous attendrait indéfiniment.
+            if not future.cancelled() and future.exception() is not None:
+                self.error.emit(self.roots[index], repr(future.exception()))
+                queue.put(('done', index))
+
+        # ProcessPoolExecutor plutôt que multiprocessing.Pool: la mort d'un processus
+        # fait échouer ses tâches au lieu de les perdre silencieusement.
+        with ProcessPoolExecutor(size, mp_context=_MP, initializer=_init_scan_process,
+                                 initargs=(self._stop_flag, queue, self.progress_count)) as pool:
+            for i in range(len(self.roots)):
+                future = pool.submit(_scan_root, i, self.roots, self.patterns, self.one_filesystem,
+                                     self.threads, self.prune, self.regex)
+                future.add_done_callback(lambda f, i=i: on_task_done(f, i))
+            # Ensemble plutôt que compteur: une tâche en échec peut être signalée deux
+            # fois (par son finally et par on_task_done).
+            pending = set(range(len(self.roots)))
+            while pending:
+                kind, value = queue.get()
+                if kind == 'found':
+                    self.foundBatch.emit(value)
+                else:
+                    pending.discard(value)
         self.finished.emit()
 
 
+class ResultsModel(QtCore.QAbstractListModel):
+    """Modèle de la liste des résultats: une simple liste de chemins (str), bien plus
+    léger qu'un QListWidgetItem par résultat.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return _display_path(self._rows[index.row()])
+        if role == Qt.UserRole:
+            # Chemin réel, à utiliser pour toute action sur le fichier.
+            return self._rows[index.row()]
+        return None
+
+    def append_many(self, paths):
+        if not paths:
+            return
+        n = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), n, n + len(paths) - 1)
+        self._rows.extend(paths)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+
 class MainWindow(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle('Recherche de fichiers - KDE (Python)')
         self.setMinimumSize(800, 500)
         self.setWindowIcon(QIcon('/home/cattac/.local/share/icons/kde_python_file_search.svg'))
-        self._stop_event = Event()
+        self._stop_flag = _MP.RawValue('b', 0)
         self.worker = None
 
         self._build_ui()
@@ -101,7 +479,7 @@ class MainWindow(QtWidgets.QWidget):
         top_row = QtWidgets.QHBoxLayout()
 
         self.search_input = QtWidgets.QLineEdit()
-        self.search_input.setPlaceholderText('Tape un mot-clé (nom partiel ou complet)')
+        self.search_input.setPlaceholderText('Tape un mot-clé (nom partiel ou complet), plusieurs séparés par des virgules, jokers: *.log')
         self.search_input.returnPressed.connect(self.start_search)
         top_row.addWidget(self.search_input)
 
@@ -135,14 +513,48 @@ class MainWindow(QtWidgets.QWidget):
 
         layout.addLayout(opts)
 
+        search_opts = QtWidgets.QHBoxLayout()
+
+        # La saisie entière est une expression régulière (pas de découpage aux virgules).
+        self.regex_cb = QtWidgets.QCheckBox('Expression régulière')
+        search_opts.addWidget(self.regex_cb)
+
+        self.one_fs_cb = QtWidgets.QCheckBox('Rester sur le système de fichiers')
+        search_opts.addWidget(self.one_fs_cb)
+
+        # Change les résultats: le contenu d'un dossier trouvé n'est pas listé.
+        self.stop_on_dir_match_cb = QtWidgets.QCheckBox('Ne pas explorer les dossiers trouvés')
+        search_opts.addWidget(self.stop_on_dir_match_cb)
+
+        # Plusieurs threads par racine: gain sur SSD/NVMe, perte sur disque rotatif,
+        # d'où une option désactivée par défaut.
+        self.parallel_cb = QtWidgets.QCheckBox('Parcours parallèle (SSD)')
+        search_opts.addWidget(self.parallel_cb)
+
+        # Nombre de processus de recherche (une racine par processus). Sur disques
+        # rotatifs, plusieurs parcours simultanés multiplient les déplacements de tête:
+        # mettre 1 dans ce cas.
+        search_opts.addWidget(QtWidgets.QLabel('Processus:'))
+        self.processes_spin = QtWidgets.QSpinBox()
+        self.processes_spin.setRange(1, os.cpu_count() or 1)
+        self.processes_spin.setValue(os.cpu_count() or 1)
+        search_opts.addWidget(self.processes_spin)
+        search_opts.addStretch()
+
+        layout.addLayout(search_opts)
+
         self.loader = QtWidgets.QProgressBar()
         self.loader.setTextVisible(False)
         self.loader.setVisible(False)
         layout.addWidget(self.loader)
 
-        self.result_list = QtWidgets.QListWidget()
+        self.result_model = ResultsModel(self)
+        self.result_list = QtWidgets.QListView()
+        self.result_list.setModel(self.result_model)
+        self.result_list.setUniformItemSizes(True)
+        self.result_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.result_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.result_list.itemDoubleClicked.connect(self.open_item)
+        self.result_list.doubleClicked.connect(self.open_item)
         self.result_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.result_list.customContextMenuRequested.connect(self.show_context_menu)
         layout.addWidget(self.result_list)
@@ -153,7 +565,14 @@ class MainWindow(QtWidgets.QWidget):
         status_row.addStretch()
         layout.addLayout(status_row)
 
+        # Progression échantillonnée à 10 Hz côté interface plutôt que signalée par
+        # les processus de recherche.
+        self._prog_timer = QtCore.QTimer(self)
+        self._prog_timer.setInterval(100)
+        self._prog_timer.timeout.connect(self.on_progress)
+
         self.custom_roots = []
+        self.failed_roots = []
 
     def add_custom_folder(self):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, 'Choisir un dossier')
@@ -172,10 +591,21 @@ class MainWindow(QtWidgets.QWidget):
             self.roots_label.setText('Racines: ' + ', '.join(self.custom_roots))
 
     def start_search(self):
-        keyword = self.search_input.text().strip()
-        if not keyword:
+        regex = self.regex_cb.isChecked()
+        if regex:
+            text = self.search_input.text().strip()
+            patterns = [text] if text else []
+        else:
+            patterns = parse_patterns(self.search_input.text())
+        if not patterns:
             self.status_label.setText('Entrer un mot-clé')
             return
+        if regex:
+            try:
+                compile_regex(patterns[0])
+            except Exception as e:
+                self.status_label.setText(f'Expression régulière invalide: {e}')
+                return
 
         roots = []
         if self.custom_roots:
@@ -184,17 +614,39 @@ class MainWindow(QtWidgets.QWidget):
             roots.append('/')
 
         if self.include_external_cb.isChecked():
-            mounts = find_mounts_external()
-            for m in mounts:
-                if m not in roots:
-                    roots.append(m)
-
-        self.result_list.clear()
-        self._stop_event.clear()
-        self.worker = SearchWorker(roots, keyword, self._stop_event)
+            roots.extend(find_mounts_external())
+
+        # Racines dédupliquées par (st_dev, st_ino): un même dossier atteint par deux
+        # chemins (lien, montage bind) n'est parcouru qu'une fois.
+        unique = []
+        seen = set()
+        for r in roots:
+            try:
+                st = os.stat(r)
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key not in seen:
+                seen.add(key)
+                unique.append(os.path.normpath(r))
+        roots = unique
+        if not roots:
+            self.status_label.setText('Aucune racine accessible')
+            return
+
+        self.result_model.clear()
+        self.failed_roots = []
+        self._stop_flag.value = 0
+        self.worker = SearchWorker(roots, patterns, self._stop_flag, self.processes_spin.value(),
+                                   self.one_fs_cb.isChecked(),
+                                   min(8, os.cpu_count() or 1) if self.parallel_cb.isChecked() else 1,
+                                   self.stop_on_dir_match_cb.isChecked(),
+                                   regex)
         self.worker.found.connect(self.on_found)
+        self.worker.foundBatch.connect(self.on_foundBatch)
+        self.worker.error.connect(self.on_error)
         self.worker.finished.connect(self.on_finished)
-        self.worker.progress.connect(self.on_progress)
+        self._prog_timer.start()
         self.loader.setRange(0, 0)
         self.loader.setVisible(True)
         self.search_button.setEnabled(False)
@@ -204,33 +656,45 @@ class MainWindow(QtWidgets.QWidget):
 
     def stop_search(self):
         if self.worker and self.worker.isRunning():
-            self._stop_event.set()
+            self._stop_flag.value = 1
+            self._prog_timer.stop()
             self.status_label.setText('Arrêt en cours...')
 
     def on_found(self, path):
-        item = QtWidgets.QListWidgetItem(path)
-        self.result_list.addItem(item)
+        self.on_foundBatch([path])
+
+    def on_foundBatch(self, paths):
+        self.result_model.append_many(paths)
 
-    def on_progress(self, n):
-        self.status_label.setText(f'Parcouru ~{n} dossiers...')
+    def on_error(self, root, message):
+        self.failed_roots.append((root, message))
+
+    def on_progress(self):
+        self.status_label.setText(f'Parcouru ~{self.worker.dirs_visited()} dossiers...')
 
     def on_finished(self):
+        self._prog_timer.stop()
         self.loader.setVisible(False)
         self.search_button.setEnabled(True)
         self.stop_button.setEnabled(False)
-        self.status_label.setText(f'Fini. {self.result_list.count()} résultats')
+        text = f'Fini. {self.result_model.rowCount()} résultats'
+        if self.failed_roots:
+            text += f" (échec: {', '.join(root for root, _ in self.failed_roots)})"
+        # Détail des erreurs au survol: rien n'est lisible sur stderr depuis le menu KDE.
+        self.status_label.setToolTip('\n'.join(f'{root}: {msg}' for root, msg in self.failed_roots))
+        self.status_label.setText(text)
 
     def show_context_menu(self, pos):
-        item = self.result_list.itemAt(pos)
-        if not item:
+        index = self.result_list.indexAt(pos)
+        if not index.isValid():
             return
-        path = item.text()
+        path = index.data(Qt.UserRole)
         menu = QtWidgets.QMenu()
         copy_act = menu.addAction('Copier le chemin')
         open_parent_act = menu.addAction('Ouvrir terminal dans le dossier parent')
         open_here_act = menu.addAction('Ouvrir terminal ici')
         open_file_act = menu.addAction('Ouvrir avec l\'application par défaut')
-        act = menu.exec_(self.result_list.mapToGlobal(pos))
+        act = menu.exec_(self.result_list.viewport().mapToGlobal(pos))
         if act == copy_act:
             QtWidgets.QApplication.clipboard().setText(path)
         elif act == open_parent_act:
@@ -244,20 +708,24 @@ class MainWindow(QtWidgets.QWidget):
             else:
                 self.open_terminal_at(os.path.dirname(path))
         elif act == open_file_act:
-            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            QDesktopServices.openUrl(_file_url(path))
 
-    def open_item(self, item):
-        path = item.text()
+    def open_item(self, index):
+        path = index.data(Qt.UserRole)
         if os.path.isdir(path):
             self.open_terminal_at(path)
         else:
-            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            QDesktopServices.openUrl(_file_url(path))
 
     def open_terminal_at(self, folder):
+        # Imports à froid: seulement utiles à l'ouverture d'un terminal, pas au
+        # démarrage (ni dans les processus de recherche qui importent ce module).
+        import subprocess
+        from shutil import which
         candidates = ['konsole', 'x-terminal-emulator', 'xfce4-terminal', 'gnome-terminal', 'urxvt', 'xterm']
         cmd = None
         for c in candidates:
-            if shutil_which(c):
+            if which(c):
                 cmd = c
                 break
         if not cmd:
@@ -274,18 +742,6 @@ class MainWindow(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, 'Erreur', f'Impossible d\'ouvrir le terminal: {e}')
 
 
-def shutil_which(prog):
-    try:
-        import shutil
-        return shutil.which(prog)
-    except Exception:
-        for path in os.environ.get('PATH', '').split(':'):
-            p = os.path.join(path, prog)
-            if os.path.exists(p) and os.access(p, os.X_OK):
-                return p
-        return None
-
-
 def main():
     app = QtWidgets.QApplication(sys.argv)
     w = MainWindow()